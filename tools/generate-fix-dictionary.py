@@ -3,325 +3,538 @@
 Generate simplified FIX dictionary XML files from the FIX Repository.
 
 Usage:
-    python generate-fix-dictionary.py <fix-repository-path> <output-dir> [versions...]
+    python generate-fix-dictionary.py [--no-cache] <fix-repository-path> <output-dir> [versions...]
 
 Example:
     python generate-fix-dictionary.py C:/fix_repository FIX.4.2 FIX.4.4
+
+Requires Python 3.10+. lxml is used for parsing and for building the output
+elements when it is installed (pip install lxml); otherwise the standard
+library ElementTree is used.
+
+Parse results are cached per version in the user cache directory
+($XDG_CACHE_HOME or ~/.cache, %LOCALAPPDATA% on Windows) and reused while
+neither the repository files nor this script have changed. Pass --no-cache
+to always parse from the repository.
 """
 
+import contextlib
+import functools
+import hashlib
 import os
+import pickle
 import sys
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import tempfile
 from collections import defaultdict
-
-
-def parse_fields(base_path):
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field as dataclass_field
+from operator import attrgetter
+from xml.sax.saxutils import quoteattr
+
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+
+# Parse results are cached in the user cache directory and reused while the
+# repository files and this script are unchanged
+SOURCE_FILES = ('Fields.xml', 'Enums.xml', 'Messages.xml', 'Components.xml', 'MsgContents.xml')
+CACHE_DIR_NAME = os.path.join('omnibridge', 'fix-dictionary')
+
+# Records are written as many small strings; buffer them into large writes
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+@dataclass(slots=True)
+class Field:
+    """A field from Fields.xml with its (value, description) enum pairs in file order."""
+    tag: int
+    name: str
+    type: str
+    enums: list = dataclass_field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Message:
+    """A message from Messages.xml with the tags and groups it contains."""
+    component_id: str
+    msg_type: str
+    name: str
+    tags: list = dataclass_field(default_factory=list)
+    groups: list = dataclass_field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Component:
+    """A component from Components.xml with the tags and groups it contains."""
+    component_id: str
+    name: str
+    type: str
+    tags: list = dataclass_field(default_factory=list)
+    groups: list = dataclass_field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Content:
+    """A MsgContent row: one tag or component reference within a message/component."""
+    tag_text: str
+    indent: int
+    position: int
+
+
+@dataclass(slots=True)
+class TagRef:
+    """A plain tag used by a message/component."""
+    tag: int
+    indent: int
+
+
+@dataclass(slots=True)
+class CountTagRef:
+    """A NumInGroup tag used by a message/component, starting a repeating group."""
+    count_tag: int
+    count_name: str
+    indent: int
+
+
+@dataclass(slots=True)
+class ComponentRef:
+    """A component referenced by a message/component."""
+    component_id: str
+    component_name: str
+    indent: int
+
+
+@dataclass(slots=True)
+class Group:
+    """A repeating group derived from a BlockRepeating component."""
+    name: str
+    count_tag: int
+    first_tag: int
+    member_tags: list
+
+
+def iter_records(path, tag):
+    """Stream the <tag> records of a repository file, freeing each one once it has been processed."""
+    if HAVE_LXML:
+        for _, elem in ET.iterparse(path, events=('end',), tag=tag):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        root = None
+        for event, elem in ET.iterparse(path, events=('start', 'end')):
+            if root is None:
+                root = elem
+            elif event == 'end' and elem.tag == tag:
+                yield elem
+                root.clear()
+
+
+def child_texts(elem):
+    """Return a dict of child tag -> text for a record, collected in a single pass over its children."""
+    return {child.tag: child.text for child in elem}
+
+
+def parse_fields(path):
     """Parse Fields.xml and return a dict of tag -> field info."""
     fields = {}
-    tree = ET.parse(os.path.join(base_path, 'Fields.xml'))
-    root = tree.getroot()
-
-    for field in root.findall('Field'):
-        tag = int(field.find('Tag').text)
-        name = field.find('Name').text
-        field_type = field.find('Type').text
-        fields[tag] = {
-            'tag': tag,
-            'name': name,
-            'type': field_type,
-            'enums': {}
-        }
+
+    for field in iter_records(path, 'Field'):
+        t = child_texts(field)
+        tag = int(t['Tag'])
+        name = t['Name']
+        field_type = t['Type']
+        fields[tag] = Field(tag, name, field_type)
 
     return fields
 
 
-def parse_enums(base_path, fields):
+def parse_enums(path, fields):
     """Parse Enums.xml and add enum values to fields."""
-    tree = ET.parse(os.path.join(base_path, 'Enums.xml'))
-    root = tree.getroot()
-
-    for enum in root.findall('Enum'):
-        tag = int(enum.find('Tag').text)
-        value = enum.find('Value').text
-        symbolic_name = enum.find('SymbolicName')
-        desc = enum.find('Description')
+    # (tag, value) -> index in the field's enum list; a repeated value replaces the earlier description
+    enum_index = {}
 
-        description = symbolic_name.text if symbolic_name is not None else (desc.text if desc is not None else value)
+    for enum in iter_records(path, 'Enum'):
+        t = child_texts(enum)
+        tag = int(t['Tag'])
+        value = t['Value']
+        description = t.get('SymbolicName', t.get('Description', value))
 
         if tag in fields:
-            fields[tag]['enums'][value] = description
+            enums = fields[tag].enums
+            index = enum_index.get((tag, value))
+            if index is None:
+                enum_index[(tag, value)] = len(enums)
+                enums.append((value, description))
+            else:
+                enums[index] = (value, description)
 
 
-def parse_messages(base_path):
+def parse_messages(path):
     """Parse Messages.xml and return a dict of componentId -> message info."""
     messages = {}
-    tree = ET.parse(os.path.join(base_path, 'Messages.xml'))
-    root = tree.getroot()
-
-    for msg in root.findall('Message'):
-        component_id = msg.find('ComponentID').text
-        msg_type = msg.find('MsgType').text
-        name = msg.find('Name').text
-
-        messages[component_id] = {
-            'componentId': component_id,
-            'msgType': msg_type,
-            'name': name,
-            'tags': [],
-            'groups': []
-        }
+
+    for msg in iter_records(path, 'Message'):
+        t = child_texts(msg)
+        component_id = t['ComponentID']
+        msg_type = t['MsgType']
+        name = t['Name']
+
+        messages[component_id] = Message(component_id, msg_type, name)
 
     return messages
 
 
-def parse_components(base_path):
+def parse_components(path):
     """Parse Components.xml and return a dict of componentId -> component info."""
     components = {}
-    tree = ET.parse(os.path.join(base_path, 'Components.xml'))
-    root = tree.getroot()
-
-    for comp in root.findall('Component'):
-        component_id = comp.find('ComponentID').text
-        name = comp.find('Name').text
-        comp_type = comp.find('ComponentType').text
-
-        components[component_id] = {
-            'componentId': component_id,
-            'name': name,
-            'type': comp_type,
-            'tags': [],
-            'groups': []
-        }
 
-    return components
+    for comp in iter_records(path, 'Component'):
+        t = child_texts(comp)
+        component_id = t['ComponentID']
+        name = t['Name']
+        comp_type = t['ComponentType']
 
+        components[component_id] = Component(component_id, name, comp_type)
+
+    return components
 
-def parse_msg_contents(base_path, messages, components, fields):
-    """Parse MsgContents.xml and associate tags with messages/components."""
-    tree = ET.parse(os.path.join(base_path, 'MsgContents.xml'))
-    root = tree.getroot()
 
+def parse_msg_contents(path, messages, components, fields, num_in_group_tags):
+    """Parse MsgContents.xml, associate tags with messages/components and return the repeating groups."""
     # Group contents by component ID
     component_contents = defaultdict(list)
 
-    for content in root.findall('MsgContent'):
-        component_id = content.find('ComponentID').text
-        tag_text = content.find('TagText').text
-        indent = int(content.find('Indent').text) if content.find('Indent') is not None else 0
-        position = int(content.find('Position').text) if content.find('Position') is not None else 0
+    for content in iter_records(path, 'MsgContent'):
+        t = child_texts(content)
+        tag_text = t['TagText']
+
+        # Skip standard header/trailer before decoding the rest of the row
+        if tag_text in ('StandardHeader', 'StandardTrailer'):
+            continue
+
+        # Skip rows that belong to neither a message nor a component
+        component_id = t['ComponentID']
+        if component_id not in messages and component_id not in components:
+            continue
+
+        indent = int(t.get('Indent', 0))
+        position = int(t.get('Position', 0))
+
+        component_contents[component_id].append(Content(tag_text, indent, position))
+
+    # Index components by name for component reference lookups
+    comp_by_name = {c.name: c for c in components.values()}
+
+    # Cache tag classification: tagText -> (is numeric, tag, field, is NumInGroup)
+    tag_cache = {}
 
-        component_contents[component_id].append({
-            'tagText': tag_text,
-            'indent': indent,
-            'position': position
-        })
+    # Bind lookups used in the per-row loop to locals
+    fields_get = fields.get
+    messages_get = messages.get
+    components_get = components.get
+    comp_by_name_get = comp_by_name.get
+    tag_cache_get = tag_cache.get
 
-    # Sort by position
-    for comp_id in component_contents:
-        component_contents[comp_id].sort(key=lambda x: x['position'])
+    # Repeating groups found while processing, keyed by component ID
+    repeating_groups = {}
 
-    # Process each component's contents
+    # Process each component's contents in position order
     for comp_id, contents in component_contents.items():
-        target = messages.get(comp_id) or components.get(comp_id)
-        if target is None:
-            continue
+        target = messages_get(comp_id) or components_get(comp_id)
+        contents.sort(key=attrgetter('position'))
 
-        for item in contents:
-            tag_text = item['tagText']
-            indent = item['indent']
+        # BlockRepeating components also define a group: the first NumInGroup
+        # field is its count tag and indented fields are its members
+        comp = components_get(comp_id)
+        is_repeating = comp is not None and comp.type == 'BlockRepeating'
+        count_tag = None
+        first_tag = None
+        member_tags = []
 
-            # Skip standard header/trailer
-            if tag_text in ('StandardHeader', 'StandardTrailer'):
-                continue
+        for item in contents:
+            tag_text = item.tag_text
+            indent = item.indent
+
+            entry = tag_cache_get(tag_text)
+            if entry is None:
+                is_digit = tag_text.isdigit()
+                tag = int(tag_text) if is_digit else None
+                field = fields_get(tag) if is_digit else None
+                is_num_in_group = tag in num_in_group_tags
+                entry = tag_cache[tag_text] = (is_digit, tag, field, is_num_in_group)
+            is_digit, tag, field, is_num_in_group = entry
 
             # Check if it's a numeric tag
-            if tag_text.isdigit():
-                tag = int(tag_text)
-                if tag in fields:
-                    field = fields[tag]
+            if is_digit:
+                if field is not None:
                     # Check if this is a NumInGroup field (repeating group start)
-                    if field['type'] == 'NumInGroup':
-                        target['groups'].append({
-                            'countTag': tag,
-                            'countName': field['name'],
-                            'indent': indent
-                        })
+                    if is_num_in_group:
+                        target.groups.append(CountTagRef(tag, field.name, indent))
                     else:
-                        target['tags'].append({
-                            'tag': tag,
-                            'indent': indent
-                        })
-            else:
-                # It's a component reference
-                if tag_text in [c['name'] for c in components.values()]:
-                    # Find the component and get its ID
-                    ref_comp = next((c for c in components.values() if c['name'] == tag_text), None)
-                    if ref_comp:
-                        target['groups'].append({
-                            'componentRef': ref_comp['componentId'],
-                            'componentName': tag_text,
-                            'indent': indent
-                        })
-
-    return component_contents
-
-
-def identify_repeating_groups(components, component_contents, fields):
-    """Identify repeating groups and their member fields."""
-    groups = {}
-
-    for comp_id, comp in components.items():
-        if comp['type'] == 'BlockRepeating':
-            contents = component_contents.get(comp_id, [])
-            if not contents:
-                continue
-
-            # Find the count tag (first NumInGroup field)
-            count_tag = None
-            first_tag = None
-            member_tags = []
-
-            for item in contents:
-                tag_text = item['tagText']
-                if tag_text.isdigit():
-                    tag = int(tag_text)
-                    if tag in fields:
-                        field = fields[tag]
-                        if field['type'] == 'NumInGroup' and count_tag is None:
+                        target.tags.append(TagRef(tag, indent))
+
+                    if is_repeating:
+                        if is_num_in_group and count_tag is None:
                             count_tag = tag
-                        elif item['indent'] >= 1:  # Member of the group
+                        elif indent >= 1:  # Member of the group
                             if first_tag is None:
                                 first_tag = tag
                             member_tags.append(tag)
+            else:
+                # It's a component reference
+                ref_comp = comp_by_name_get(tag_text)
+                if ref_comp:
+                    target.groups.append(ComponentRef(ref_comp.component_id, tag_text, indent))
 
-            if count_tag and first_tag:
-                groups[comp['name']] = {
-                    'name': comp['name'],
-                    'countTag': count_tag,
-                    'firstTag': first_tag,
-                    'memberTags': member_tags
-                }
+        if is_repeating and count_tag and first_tag:
+            repeating_groups[comp_id] = Group(comp.name, count_tag, first_tag, member_tags)
+
+    # Key groups by name, in component order
+    return {
+        comp.name: repeating_groups[comp_id]
+        for comp_id, comp in components.items()
+        if comp_id in repeating_groups
+    }
+
+
+def write_section(f, name, records, build_element):
+    """Write a top-level section, building, serializing and discarding one record element at a time."""
+    if not records:
+        f.write(f'  <{name}/>\n')
+        return
 
-    return groups
+    f.write(f'  <{name}>\n')
+    for record in records:
+        el = build_element(record)
+        ET.indent(el, space='  ', level=2)
+        xml = ET.tostring(el, encoding='unicode')
+        if not HAVE_LXML:
+            # ElementTree writes empty elements as <x />; match lxml's <x/>
+            xml = xml.replace(' />', '/>')
+        f.write('    ' + xml + '\n')
+    f.write(f'  </{name}>\n')
+
+
+def field_element(field):
+    """Build the <field> element for a field and its enums."""
+    field_el = ET.Element('field')
+    field_el.set('tag', str(field.tag))
+    field_el.set('name', field.name)
+    field_el.set('type', field.type)
+
+    # Add enums; values are unique per field, so this sorts by value only
+    for value, desc in sorted(field.enums):
+        enum_el = ET.SubElement(field_el, 'enum')
+        enum_el.set('value', value)
+        enum_el.set('desc', desc[:100] if desc else value)  # Truncate long descriptions
+
+    return field_el
+
+
+def group_element(group):
+    """Build the <group> element for a repeating group."""
+    group_el = ET.Element('group')
+    group_el.set('name', group.name)
+    group_el.set('countTag', str(group.count_tag))
+    group_el.set('firstTag', str(group.first_tag))
+
+    for tag in group.member_tags:
+        member_el = ET.SubElement(group_el, 'member')
+        member_el.set('tag', str(tag))
+
+    return group_el
+
+
+def message_element(msg, groups, groups_by_count_tag):
+    """Build the <message> element for a message with its tags and group references."""
+    msg_el = ET.Element('message')
+    msg_el.set('msgType', msg.msg_type)
+    msg_el.set('name', msg.name)
+
+    # Add tags
+    for tag_info in msg.tags:
+        tag_el = ET.SubElement(msg_el, 'tag')
+        tag_el.set('id', str(tag_info.tag))
+
+    # Add group references
+    for group_info in msg.groups:
+        if isinstance(group_info, CountTagRef):
+            # Direct group (NumInGroup field)
+            group_name = groups_by_count_tag.get(group_info.count_tag)
+            if group_name is not None:
+                group_ref_el = ET.SubElement(msg_el, 'groupRef')
+                group_ref_el.set('name', group_name)
+        elif isinstance(group_info, ComponentRef):
+            # Component reference
+            comp_name = group_info.component_name
+            if comp_name in groups:
+                group_ref_el = ET.SubElement(msg_el, 'groupRef')
+                group_ref_el.set('name', comp_name)
+
+    return msg_el
 
 
 def generate_xml(version, fields, messages, components, groups, output_path):
-    """Generate the simplified FIX dictionary XML."""
-    root = ET.Element('fix-dictionary')
-    root.set('version', version)
-
-    # Add fields section
-    fields_el = ET.SubElement(root, 'fields')
-    for tag in sorted(fields.keys()):
-        field = fields[tag]
-        field_el = ET.SubElement(fields_el, 'field')
-        field_el.set('tag', str(field['tag']))
-        field_el.set('name', field['name'])
-        field_el.set('type', field['type'])
-
-        # Add enums
-        for value, desc in sorted(field['enums'].items()):
-            enum_el = ET.SubElement(field_el, 'enum')
-            enum_el.set('value', value)
-            enum_el.set('desc', desc[:100] if desc else value)  # Truncate long descriptions
-
-    # Add groups section
-    groups_el = ET.SubElement(root, 'groups')
-    for name in sorted(groups.keys()):
-        group = groups[name]
-        group_el = ET.SubElement(groups_el, 'group')
-        group_el.set('name', group['name'])
-        group_el.set('countTag', str(group['countTag']))
-        group_el.set('firstTag', str(group['firstTag']))
-
-        for tag in group['memberTags']:
-            member_el = ET.SubElement(group_el, 'member')
-            member_el.set('tag', str(tag))
-
-    # Add messages section
-    messages_el = ET.SubElement(root, 'messages')
-    for comp_id in sorted(messages.keys(), key=lambda x: messages[x]['msgType']):
-        msg = messages[comp_id]
-        msg_el = ET.SubElement(messages_el, 'message')
-        msg_el.set('msgType', msg['msgType'])
-        msg_el.set('name', msg['name'])
-
-        # Add tags
-        for tag_info in msg['tags']:
-            tag_el = ET.SubElement(msg_el, 'tag')
-            tag_el.set('id', str(tag_info['tag']))
-
-        # Add group references
-        for group_info in msg['groups']:
-            if 'countTag' in group_info:
-                # Direct group (NumInGroup field)
-                count_tag = group_info['countTag']
-                count_name = group_info['countName']
-                # Find matching group definition
-                for group_name, group_def in groups.items():
-                    if group_def['countTag'] == count_tag:
-                        group_ref_el = ET.SubElement(msg_el, 'groupRef')
-                        group_ref_el.set('name', group_name)
-                        break
-            elif 'componentName' in group_info:
-                # Component reference
-                comp_name = group_info['componentName']
-                if comp_name in groups:
-                    group_ref_el = ET.SubElement(msg_el, 'groupRef')
-                    group_ref_el.set('name', comp_name)
-
-    # Pretty print
-    xml_str = ET.tostring(root, encoding='unicode')
-    dom = minidom.parseString(xml_str)
-    pretty_xml = dom.toprettyxml(indent='  ')
-
-    # Remove extra blank lines
-    lines = [line for line in pretty_xml.split('\n') if line.strip()]
-    pretty_xml = '\n'.join(lines)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(pretty_xml)
-
-    print(f"Generated {output_path}")
-    print(f"  Fields: {len(fields)}")
-    print(f"  Messages: {len(messages)}")
-    print(f"  Groups: {len(groups)}")
-
-
-def process_version(repo_path, version, output_dir):
-    """Process a single FIX version."""
-    base_path = os.path.join(repo_path, version, 'Base')
+    """Generate the simplified FIX dictionary XML, streaming each record straight to the file.
+
+    Returns the summary lines to report for the generated file.
+    """
+    # Index groups by count tag; the first group defined for a count tag wins
+    groups_by_count_tag = {}
+    for group_name, group_def in groups.items():
+        groups_by_count_tag.setdefault(group_def.count_tag, group_name)
+
+    with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write('<?xml version="1.0" ?>\n')
+        f.write(f'<fix-dictionary version={quoteattr(version)}>\n')
+
+        write_section(f, 'fields', sorted(fields.values(), key=attrgetter('tag')), field_element)
+        write_section(f, 'groups', sorted(groups.values(), key=attrgetter('name')), group_element)
+        write_section(f, 'messages', sorted(messages.values(), key=attrgetter('msg_type')),
+                      functools.partial(message_element, groups=groups, groups_by_count_tag=groups_by_count_tag))
+
+        f.write('</fix-dictionary>')
+
+    return [
+        f"Generated {output_path}",
+        f"  Fields: {len(fields)}",
+        f"  Messages: {len(messages)}",
+        f"  Groups: {len(groups)}",
+    ]
+
+
+def source_paths(base_path):
+    """Return the path of each repository file a version is parsed from, keyed by file name."""
+    return {name: os.path.join(base_path, name) for name in SOURCE_FILES}
+
+
+def source_mtimes(paths):
+    """Return the modification times of the repository files a version is parsed from."""
+    return tuple(os.path.getmtime(paths[name]) for name in SOURCE_FILES)
+
+
+@functools.lru_cache(maxsize=None)
+def generator_digest():
+    """Return a hash of this script, so cached results are dropped whenever it changes."""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def cache_dir():
+    """Return the directory parse results are cached in."""
+    base = (os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+            or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, CACHE_DIR_NAME)
 
-    if not os.path.exists(base_path):
-        print(f"Warning: {base_path} not found, skipping {version}")
-        return
 
-    print(f"\nProcessing {version}...")
+def cache_path_for(base_path, version):
+    """Return the cache file for a version's Base/ directory."""
+    path_hash = hashlib.sha256(os.path.abspath(base_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir(), f"{version}-{path_hash}.pickle")
 
-    # Parse all files
-    fields = parse_fields(base_path)
-    parse_enums(base_path, fields)
-    messages = parse_messages(base_path)
-    components = parse_components(base_path)
-    component_contents = parse_msg_contents(base_path, messages, components, fields)
-    groups = identify_repeating_groups(components, component_contents, fields)
+
+def cache_key(base_path, paths):
+    """Return the key cached results are valid for: this script, the Base/ directory and its file mtimes."""
+    return generator_digest(), os.path.abspath(base_path), source_mtimes(paths)
+
+
+def load_cache(cache_path, key):
+    """Return cached parse results if they were built for the given key, else None."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, parsed = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, TypeError):
+        return None  # Missing, unreadable or incompatible cache
+
+    if cached_key != key:
+        return None
+    return parsed
+
+
+def save_cache(cache_path, key, parsed):
+    """Write parse results to the cache, returning a warning line if it cannot be written.
+
+    The pickle is written to a temporary file and moved into place, so concurrent or
+    interrupted runs never leave a half-written cache for another run to read.
+    """
+    directory = os.path.dirname(cache_path)
+    tmp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            pickle.dump((key, parsed), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+        return f"Warning: could not write cache {cache_path}: {e}"
+    return None
+
+
+def parse_version(paths):
+    """Parse all repository files for a version."""
+    fields = parse_fields(paths['Fields.xml'])
+    parse_enums(paths['Enums.xml'], fields)
+    num_in_group_tags = frozenset(tag for tag, field in fields.items() if field.type == 'NumInGroup')
+    messages = parse_messages(paths['Messages.xml'])
+    components = parse_components(paths['Components.xml'])
+    groups = parse_msg_contents(paths['MsgContents.xml'], messages, components, fields, num_in_group_tags)
+    return fields, messages, components, groups
+
+
+def process_version(repo_path, version, output_dir, use_cache=True):
+    """Process a single FIX version and return the lines to report for it."""
+    base_path = os.path.join(repo_path, version, 'Base')
+
+    if not os.path.exists(base_path):
+        return [f"Warning: {base_path} not found, skipping {version}"]
+
+    lines = [f"\nProcessing {version}..."]
+
+    # Parse all files, reusing the cached results if nothing has changed
+    paths = source_paths(base_path)
+    if not use_cache:
+        parsed = parse_version(paths)
+    else:
+        key = cache_key(base_path, paths)
+        cache_path = cache_path_for(base_path, version)
+        parsed = load_cache(cache_path, key)
+        if parsed is None:
+            parsed = parse_version(paths)
+            warning = save_cache(cache_path, key, parsed)
+            if warning:
+                lines.append(warning)
+        else:
+            lines.append(f"  Using cached parse from {cache_path}")
+
+    fields, messages, components, groups = parsed
 
     # Generate output
     output_name = version.replace('.', '') + '.xml'
     output_path = os.path.join(output_dir, output_name)
-    generate_xml(version, fields, messages, components, groups, output_path)
+    lines.extend(generate_xml(version, fields, messages, components, groups, output_path))
+    return lines
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python generate-fix-dictionary.py <fix-repository-path> <output-dir> [versions...]")
+    use_cache = '--no-cache' not in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+
+    if len(args) < 2:
+        print("Usage: python generate-fix-dictionary.py [--no-cache] <fix-repository-path> <output-dir> [versions...]")
         print("Example: python generate-fix-dictionary.py C:/fix_repository ./output FIX.4.2 FIX.4.4")
         sys.exit(1)
 
-    repo_path = sys.argv[1]
-    output_dir = sys.argv[2]
-    versions = sys.argv[3:] if len(sys.argv) > 3 else ['FIX.4.0', 'FIX.4.1', 'FIX.4.2', 'FIX.4.3', 'FIX.4.4']
+    repo_path = args[0]
+    output_dir = args[1]
+    versions = args[2:] if len(args) > 2 else ['FIX.4.0', 'FIX.4.1', 'FIX.4.2', 'FIX.4.3', 'FIX.4.4']
 
     # Handle nested directory structure
     inner_path = os.path.join(repo_path, os.path.basename(repo_path))
@@ -334,8 +547,17 @@ def main():
 
     os.makedirs(output_dir, exist_ok=True)
 
-    for version in versions:
-        process_version(repo_path, version, output_dir)
+    print(f"XML backend: {ET.__name__}")
+
+    # Versions are independent, so several are processed in parallel. Each returns its
+    # report lines, printed here in version order so they are not interleaved.
+    process = functools.partial(process_version, repo_path, output_dir=output_dir, use_cache=use_cache)
+    if len(versions) == 1:
+        print('\n'.join(process(versions[0])))
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(versions), os.cpu_count() or 1)) as executor:
+            for lines in executor.map(process, versions):
+                print('\n'.join(lines))
 
     print("\nDone!")
 